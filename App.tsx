@@ -1,13 +1,17 @@
-import React, { useState } from 'react';
+import React, { useState, lazy, Suspense } from 'react';
 import { AuthProvider, useAuth } from './contexts/AuthContext';
 import Auth from './components/Auth';
 import Navbar from './components/Navbar';
 import MatrixRain from './components/MatrixRain';
+import PageLoadErrorBoundary from './components/PageLoadErrorBoundary';
 import HomePage from './components/pages/HomePage';
-import AnalysisPage from './components/pages/AnalysisPage';
 import ProfilePage from './components/pages/ProfilePage';
 import ContactPage from './components/pages/ContactPage';
 
+// The analysis page (input, results view and its icons) is only reachable after
+// sign-in, so it is split out of the initial bundle and fetched on first visit.
+const AnalysisPage = lazy(() => import('./components/pages/AnalysisPage'));
+
 export type Page = 'home' | 'analyze' | 'profile' | 'contact';
 
 const AppContent: React.FC = () => {
@@ -44,7 +48,19 @@ const AppContent: React.FC = () => {
       case 'home':
         return <HomePage onNavigate={(page) => setCurrentPage(page)} />;
       case 'analyze':
-        return <AnalysisPage />;
+        return (
+          <PageLoadErrorBoundary>
+            <Suspense
+              fallback={
+                <div className="flex justify-center py-16">
+                  <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-white"></div>
+                </div>
+              }
+            >
+              <AnalysisPage />
+            </Suspense>
+          </PageLoadErrorBoundary>
+        );
       case 'profile':
         return <ProfilePage />;
       case 'contact':
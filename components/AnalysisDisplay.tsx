@@ -8,85 +8,103 @@ import { ActionIcon } from './icons/ActionIcon';
 import { SummaryIcon } from './icons/SummaryIcon';
 import { DownloadIcon } from './icons/DownloadIcon';
 
+type Polarity = AnalysisResult['sentiment']['polarity'];
+
+// Polarity -> Tailwind classes, looked up directly instead of switching on every render.
+const SENTIMENT_CONTAINER_CLASSES: Record<Polarity, string> = {
+  Positive: 'bg-gradient-to-br from-green-900/40 to-black/60 border-green-800/50',
+  Negative: 'bg-gradient-to-br from-red-900/40 to-black/60 border-red-800/50',
+  Neutral: 'bg-gradient-to-br from-gray-800/40 to-black/60 border-gray-700/50',
+};
+
+const SENTIMENT_PILL_CLASSES: Record<Polarity, string> = {
+  Positive: 'bg-green-900/70 text-green-200',
+  Negative: 'bg-red-900/70 text-red-200',
+  Neutral: 'bg-gray-800/70 text-gray-300',
+};
+
+// Entry animation shared by every card; each card staggers it via animationDelay.
+const CARD_ANIMATION_CLASS = 'opacity-0 animate-fade-in-up will-change-transform-opacity';
+
+// Card components live at module scope so their identity is stable across
+// renders; defining them inside AnalysisDisplay remounted every card (and
+// replayed its entry animation) whenever the parent re-rendered.
+interface CardProps {
+  icon: React.ReactNode;
+  title: string;
+  children: React.ReactNode;
+  className?: string;
+  style?: React.CSSProperties;
+}
+
+const Card: React.FC<CardProps> = ({ icon, title, children, className = '', style }) => (
+  <div
+    className={`bg-gradient-to-b from-white/10 via-black/60 to-black/90 border border-white/20 rounded-xl shadow-lg overflow-hidden backdrop-blur-sm ${className}`}
+    style={style}
+  >
+    <div className="p-4 bg-black/50 flex items-center space-x-3 border-b border-gray-800/60">
+      <div className="text-gray-400">{icon}</div>
+      <h3 className="text-xl font-bold text-gray-100">{title}</h3>
+    </div>
+    <div className="p-4 text-white">
+      {children}
+    </div>
+  </div>
+);
+
+interface ListCardProps {
+  icon: React.ReactNode;
+  title: string;
+  items: string[];
+  className?: string;
+  style?: React.CSSProperties;
+}
+
+const ListCard: React.FC<ListCardProps> = ({ icon, title, items, className, style }) => {
+  if (!items || items.length === 0) return null;
+  return (
+    <Card icon={icon} title={title} className={className} style={style}>
+      <ul className="space-y-2 list-disc list-inside">
+        {items.map((item, index) => (
+          <li key={index}>{item}</li>
+        ))}
+      </ul>
+    </Card>
+  );
+};
+
+// Plain list sections rendered with ListCard, in display order.
+const LIST_SECTIONS: { key: 'problems' | 'solutions'; title: string; icon: React.ReactNode }[] = [
+  { key: 'problems', title: 'Identified Problems', icon: <ProblemIcon /> },
+  { key: 'solutions', title: 'Proposed Solutions', icon: <SolutionIcon /> },
+];
+
 interface AnalysisDisplayProps {
   result: AnalysisResult;
 }
 
 const AnalysisDisplay: React.FC<AnalysisDisplayProps> = ({ result }) => {
   const handleDownloadActionItems = () => {
-    const jsonString = `data:text/json;charset=utf-8,${encodeURIComponent(
-      JSON.stringify({ actionItems: result.actionItems }, null, 2)
-    )}`;
+    // Hand the serialized JSON to the browser as a Blob rather than
+    // percent-encoding a second copy of it into a data: URL.
+    const blob = new Blob(
+      [JSON.stringify({ actionItems: result.actionItems }, null, 2)],
+      { type: 'application/json' }
+    );
+    const url = URL.createObjectURL(blob);
     const link = document.createElement('a');
-    link.href = jsonString;
+    link.href = url;
     link.download = 'action_items.json';
     link.click();
+    // The download reads the Blob asynchronously; revoking in the same tick
+    // can cancel it or save an empty file in Firefox and Safari.
+    setTimeout(() => URL.revokeObjectURL(url), 0);
   };
 
-  interface CardProps {
-    icon: React.ReactNode;
-    title: string;
-    children: React.ReactNode;
-    className?: string;
-    style?: React.CSSProperties;
-  }
-
-  const Card: React.FC<CardProps> = ({ icon, title, children, className = '', style }) => (
-    <div
-      className={`bg-gradient-to-b from-white/10 via-black/60 to-black/90 border border-white/20 rounded-xl shadow-lg overflow-hidden backdrop-blur-sm ${className}`}
-      style={style}
-    >
-      <div className="p-4 bg-black/50 flex items-center space-x-3 border-b border-gray-800/60">
-        <div className="text-gray-400">{icon}</div>
-        <h3 className="text-xl font-bold text-gray-100">{title}</h3>
-      </div>
-      <div className="p-4 text-white">
-        {children}
-      </div>
-    </div>
-  );
-  
-  interface ListCardProps {
-    icon: React.ReactNode;
-    title: string;
-    items: string[];
-    className?: string;
-    style?: React.CSSProperties;
-  }
-
-  const ListCard: React.FC<ListCardProps> = ({ icon, title, items, className, style }) => {
-    if (!items || items.length === 0) return null;
-    return (
-      <Card icon={icon} title={title} className={className} style={style}>
-        <ul className="space-y-2 list-disc list-inside">
-          {items.map((item, index) => (
-            <li key={index}>{item}</li>
-          ))}
-        </ul>
-      </Card>
-    );
-  };
-  
-  const getSentimentContainerClasses = () => {
-    switch (result.sentiment.polarity) {
-      case 'Positive':
-        return 'bg-gradient-to-br from-green-900/40 to-black/60 border-green-800/50';
-      case 'Negative':
-        return 'bg-gradient-to-br from-red-900/40 to-black/60 border-red-800/50';
-      default:
-        return 'bg-gradient-to-br from-gray-800/40 to-black/60 border-gray-700/50';
-    }
-  };
-
-  const getSentimentPillClasses = () => {
-    switch (result.sentiment.polarity) {
-        case 'Positive': return 'bg-green-900/70 text-green-200';
-        case 'Negative': return 'bg-red-900/70 text-red-200';
-        default: return 'bg-gray-800/70 text-gray-300';
-    }
-  };
+  // Unknown polarities fall back to the neutral styling.
+  const sentimentContainerClasses = SENTIMENT_CONTAINER_CLASSES[result.sentiment.polarity] ?? SENTIMENT_CONTAINER_CLASSES.Neutral;
+  const sentimentPillClasses = SENTIMENT_PILL_CLASSES[result.sentiment.polarity] ?? SENTIMENT_PILL_CLASSES.Neutral;
 
-  const animationClass = "opacity-0 animate-fade-in-up will-change-transform-opacity";
   let visibleChildIndex = 0;
 
   return (
@@ -94,7 +112,7 @@ const AnalysisDisplay: React.FC<AnalysisDisplayProps> = ({ result }) => {
       <Card 
         icon={<ClipboardIcon />} 
         title="Call Theme"
-        className={animationClass}
+        className={CARD_ANIMATION_CLASS}
         style={{ animationDelay: `${visibleChildIndex++ * 100}ms` }}
       >
         <h4 className="font-bold text-lg text-gray-100 mb-1">{result.theme.classification}</h4>
@@ -104,13 +122,13 @@ const AnalysisDisplay: React.FC<AnalysisDisplayProps> = ({ result }) => {
       <Card
         icon={<SentimentIcon />}
         title="Sentiment Analysis"
-        className={animationClass}
+        className={CARD_ANIMATION_CLASS}
         style={{ animationDelay: `${visibleChildIndex++ * 100}ms` }}
       >
-        <div className={`p-4 rounded-lg border ${getSentimentContainerClasses()}`}>
+        <div className={`p-4 rounded-lg border ${sentimentContainerClasses}`}>
           <div className="flex items-center justify-between">
             <h4 className="font-bold text-lg">Overall Sentiment</h4>
-            <span className={`px-3 py-1 text-sm font-semibold rounded-full ${getSentimentPillClasses()}`}>
+            <span className={`px-3 py-1 text-sm font-semibold rounded-full ${sentimentPillClasses}`}>
               {result.sentiment.polarity}
             </span>
           </div>
@@ -129,31 +147,26 @@ const AnalysisDisplay: React.FC<AnalysisDisplayProps> = ({ result }) => {
         </div>
       </Card>
 
-      {result.problems && result.problems.length > 0 && (
-        <ListCard
-          icon={<ProblemIcon />}
-          title="Identified Problems"
-          items={result.problems}
-          className={animationClass}
-          style={{ animationDelay: `${visibleChildIndex++ * 100}ms` }}
-        />
-      )}
+      {LIST_SECTIONS.map(({ key, title, icon }) => {
+        const items = result[key];
+        if (!items || items.length === 0) return null;
+        return (
+          <ListCard
+            key={key}
+            icon={icon}
+            title={title}
+            items={items}
+            className={CARD_ANIMATION_CLASS}
+            style={{ animationDelay: `${visibleChildIndex++ * 100}ms` }}
+          />
+        );
+      })}
 
-      {result.solutions && result.solutions.length > 0 && (
-        <ListCard
-          icon={<SolutionIcon />}
-          title="Proposed Solutions"
-          items={result.solutions}
-          className={animationClass}
-          style={{ animationDelay: `${visibleChildIndex++ * 100}ms` }}
-        />
-      )}
-      
       {result.actionItems && result.actionItems.length > 0 && (
         <Card
           icon={<ActionIcon />}
           title="Action Items"
-          className={animationClass}
+          className={CARD_ANIMATION_CLASS}
           style={{ animationDelay: `${visibleChildIndex++ * 100}ms` }}
         >
           <div className="flex flex-col">
@@ -177,7 +190,7 @@ const AnalysisDisplay: React.FC<AnalysisDisplayProps> = ({ result }) => {
       <Card
         icon={<SummaryIcon />}
         title="Conversation Summary"
-        className={animationClass}
+        className={CARD_ANIMATION_CLASS}
         style={{ animationDelay: `${visibleChildIndex++ * 100}ms` }}
       >
         <p className="whitespace-pre-wrap">{result.summary}</p>
@@ -186,4 +199,6 @@ const AnalysisDisplay: React.FC<AnalysisDisplayProps> = ({ result }) => {
   );
 };
 
-export default AnalysisDisplay;
\ No newline at end of file
+// Memoized so edits in the transcript box, which re-render AnalysisPage on
+// every keystroke, don't re-render the results below it.
+export default React.memo(AnalysisDisplay);
\ No newline at end of file
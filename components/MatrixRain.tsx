@@ -15,15 +15,18 @@ const MatrixRain: React.FC = () => {
       canvas.height = window.innerHeight;
     };
     resizeCanvas();
-    window.addEventListener('resize', resizeCanvas);
 
     const fontSize = 16;
     let columns = Math.floor(canvas.width / fontSize);
-    let drops: number[] = [];
+    // One y-position per column, allocated at its final size on each setup
+    let drops = new Float32Array(0);
 
     const setup = () => {
+        // Resizing the canvas resets its 2D state, so the font is (re)applied
+        // here rather than parsed again on every frame.
+        ctx.font = `${fontSize}px monospace`;
         columns = Math.floor(canvas.width / fontSize);
-        drops = [];
+        drops = new Float32Array(columns);
         for (let i = 0; i < columns; i++) {
           drops[i] = Math.random() * canvas.height;
         }
@@ -38,7 +41,6 @@ const MatrixRain: React.FC = () => {
       ctx.fillRect(0, 0, canvas.width, canvas.height);
 
       ctx.fillStyle = '#FFFFFF'; // White text
-      ctx.font = `${fontSize}px monospace`;
       
       for (let i = 0; i < drops.length; i++) {
         const char = '.';
@@ -0,0 +1,45 @@
+import React from 'react';
+
+interface PageLoadErrorBoundaryProps {
+  children: React.ReactNode;
+}
+
+interface PageLoadErrorBoundaryState {
+  hasError: boolean;
+}
+
+// Catches failures of lazily loaded pages, e.g. a network error or a chunk
+// removed by a redeploy while the tab was open. React.lazy caches the failed
+// import, so recovery is a full reload, which also picks up the new build.
+class PageLoadErrorBoundary extends React.Component<PageLoadErrorBoundaryProps, PageLoadErrorBoundaryState> {
+  state: PageLoadErrorBoundaryState = { hasError: false };
+
+  static getDerivedStateFromError(): PageLoadErrorBoundaryState {
+    return { hasError: true };
+  }
+
+  componentDidCatch(error: unknown) {
+    console.error('Failed to load page:', error);
+  }
+
+  render() {
+    if (this.state.hasError) {
+      return (
+        <div className="bg-gradient-to-b from-red-900/50 via-red-950/50 to-black/80 border border-red-700 text-red-200 px-4 py-3 rounded-lg text-center backdrop-blur-sm" role="alert">
+          <strong className="font-bold">Error: </strong>
+          <span className="block sm:inline">This page could not be loaded.</span>
+          <button
+            onClick={() => window.location.reload()}
+            className="mt-3 block mx-auto bg-gray-800/80 hover:bg-gray-700/80 text-white font-bold py-2 px-4 rounded-lg text-sm border border-gray-700/80 transition-colors"
+          >
+            Reload
+          </button>
+        </div>
+      );
+    }
+
+    return this.props.children;
+  }
+}
+
+export default PageLoadErrorBoundary;
@@ -1,19 +1,15 @@
 import React, { useState, useCallback } from 'react';
 import type { AnalysisResult } from '../../types';
-import { analyzeCallTranscript } from '../../services/geminiService';
-import { analyzeCallTranscript as demoAnalyzeCallTranscript } from '../../services/demoGeminiService';
 import { DEMO_MODE } from '../../demo-config.js';
+import { getCacheGeneration, getCachedAnalysis, setCachedAnalysis } from '../../services/analysisCache';
+import { useAuth } from '../../contexts/AuthContext';
 import TranscriptInput from '../TranscriptInput';
 import AnalysisDisplay from '../AnalysisDisplay';
 import Loader from '../Loader';
 
-const AnalysisPage: React.FC = () => {
-  const [transcript, setTranscript] = useState<string>('');
-  const [analysisResult, setAnalysisResult] = useState<AnalysisResult | null>(null);
-  const [isLoading, setIsLoading] = useState<boolean>(false);
-  const [error, setError] = useState<string | null>(null);
-
-  const sampleTranscript = `Distributor: Thanks for joining today. Before we dive in, I want to highlight recurring stock shortages in the southwest region—they’re really slowing us down.
+// Sample call loaded by the "Load Sample" button. Defined once at module scope
+// rather than rebuilt on every render.
+const SAMPLE_TRANSCRIPT = `Distributor: Thanks for joining today. Before we dive in, I want to highlight recurring stock shortages in the southwest region—they’re really slowing us down.
 Vendor: I hear you. We’ve had similar feedback from others and are looking at optimizing the supply chain. Could you specify which SKUs are affected most?
 Distributor: Mostly health and wellness products. Also, our training team still hasn’t received the updated product manuals.
 Vendor: Apologies for that. I’ll ensure the new documentation is resent today. Anything else holding back your sales?
@@ -26,19 +22,48 @@ Vendor: Thanks for flagging it. I’ll set up a review with our support team and
 Distributor: That covers my big topics. Thanks for being proactive—this is exactly the follow-up we need.
 Vendor: Likewise, thanks for the clear feedback. I’ll send detailed action items by end of day.`;
 
+const AnalysisPage: React.FC = () => {
+  const [transcript, setTranscript] = useState<string>('');
+  const [analysisResult, setAnalysisResult] = useState<AnalysisResult | null>(null);
+  const [isLoading, setIsLoading] = useState<boolean>(false);
+  const [error, setError] = useState<string | null>(null);
+  const { user } = useAuth();
+
   const handleAnalyze = useCallback(async () => {
-    if (!transcript.trim()) {
+    // Surrounding whitespace doesn't change the analysis, so trim once up front
+    // and use the trimmed text for both the cache key and the request.
+    const text = transcript.trim();
+    if (!text) {
       setError("Please enter a transcript to analyze.");
       return;
     }
+
+    // Captured before any await so a sign-out during the request (which clears
+    // the cache) also stops this analysis from writing its result back.
+    const cacheGeneration = getCacheGeneration();
+
     setIsLoading(true);
     setError(null);
     setAnalysisResult(null);
 
     try {
-      const result = DEMO_MODE 
-        ? await demoAnalyzeCallTranscript(transcript)
-        : await analyzeCallTranscript(transcript);
+      // Re-analyzing a known transcript returns the signed-in user's stored
+      // result instead of calling the API again.
+      const cachedResult = user ? await getCachedAnalysis(user.id, text) : null;
+      if (cachedResult) {
+        setAnalysisResult(cachedResult);
+        return;
+      }
+
+      // Load the analysis service on first use so the Gemini SDK is not part of
+      // the initial bundle (and is never fetched at all in demo mode).
+      const { analyzeCallTranscript } = DEMO_MODE
+        ? await import('../../services/demoGeminiService')
+        : await import('../../services/geminiService');
+      const result: AnalysisResult = await analyzeCallTranscript(text);
+      if (user) {
+        await setCachedAnalysis(user.id, text, result, cacheGeneration);
+      }
       setAnalysisResult(result);
     } catch (err) {
       setError(err instanceof Error ? err.message : "An unknown error occurred.");
@@ -46,10 +71,10 @@ Vendor: Likewise, thanks for the clear feedback. I’ll send detailed action ite
     } finally {
       setIsLoading(false);
     }
-  }, [transcript]);
+  }, [transcript, user]);
 
   const loadSample = () => {
-    setTranscript(sampleTranscript);
+    setTranscript(SAMPLE_TRANSCRIPT);
     setError(null);
     setAnalysisResult(null);
   }
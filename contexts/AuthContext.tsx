@@ -1,5 +1,6 @@
 import React, { createContext, useContext, useState, useEffect, ReactNode } from 'react';
 import { DEMO_MODE, DEMO_USERS } from '../demo-config.js';
+import { clearAnalysisCache } from '../services/analysisCache';
 
 interface User {
   id: string;
@@ -137,6 +138,9 @@ export const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
   };
 
   const logout = () => {
+    if (user) {
+      clearAnalysisCache(user.id);
+    }
     setUser(null);
     setToken(null);
     localStorage.removeItem('authToken');
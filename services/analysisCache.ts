@@ -0,0 +1,154 @@
+import type { AnalysisResult } from '../types';
+
+// Analysis results are cached per signed-in user: in memory by transcript
+// text, and in localStorage keyed by a SHA-256 hash of the transcript so
+// previously analyzed calls survive page reloads. The transcript itself is not
+// persisted, but the results are, in plaintext (theme, summary, problems,
+// solutions, action items). They stay in localStorage until that user logs
+// out or the entry is evicted, including after the tab is closed.
+//
+// Bump the version whenever AnalysisResult changes shape so entries written
+// by an older build are never handed to AnalysisDisplay.
+const STORAGE_KEY_PREFIX = 'analysisCache:v1';
+// Applies to both the in-memory and the persisted layer.
+const MAX_ENTRIES = 20;
+
+type PersistedEntry = [hash: string, result: AnalysisResult];
+
+const storageKeyFor = (userId: string) => `${STORAGE_KEY_PREFIX}:${userId}`;
+
+// Bumped by clearAnalysisCache. Writes that started before a logout compare
+// against it and are dropped, so a late-finishing analysis can't repopulate
+// the cache of a user who has already signed out.
+let cacheGeneration = 0;
+
+export const getCacheGeneration = () => cacheGeneration;
+
+// The memory layer only ever holds one user's results; it is reset whenever
+// a different user reads or writes the cache.
+let memoryOwner: string | null = null;
+
+// Map iteration follows insertion order, so re-inserting on every access keeps
+// the least recently used transcript first in line for eviction.
+const memoryCache = new Map<string, AnalysisResult>();
+
+const memoryFor = (userId: string) => {
+  if (memoryOwner !== userId) {
+    memoryCache.clear();
+    memoryOwner = userId;
+  }
+  return memoryCache;
+};
+
+const rememberInMemory = (userId: string, transcript: string, result: AnalysisResult) => {
+  const memory = memoryFor(userId);
+  memory.delete(transcript);
+  memory.set(transcript, result);
+  if (memory.size > MAX_ENTRIES) {
+    memory.delete(memory.keys().next().value!);
+  }
+};
+
+const isStringArray = (value: unknown): value is string[] =>
+  Array.isArray(value) && value.every((item) => typeof item === 'string');
+
+// Minimal structural check of a persisted result against AnalysisResult.
+const isAnalysisResult = (value: any): value is AnalysisResult =>
+  typeof value === 'object' && value !== null &&
+  typeof value.theme?.classification === 'string' &&
+  typeof value.theme?.reasoning === 'string' &&
+  typeof value.sentiment?.polarity === 'string' &&
+  isStringArray(value.sentiment?.tones) &&
+  isStringArray(value.problems) &&
+  isStringArray(value.solutions) &&
+  isStringArray(value.actionItems) &&
+  typeof value.summary === 'string';
+
+const isPersistedEntry = (value: unknown): value is PersistedEntry =>
+  Array.isArray(value) && value.length === 2 && typeof value[0] === 'string' && isAnalysisResult(value[1]);
+
+const readPersisted = (userId: string): PersistedEntry[] => {
+  try {
+    const raw = localStorage.getItem(storageKeyFor(userId));
+    const parsed = raw ? JSON.parse(raw) : [];
+    return Array.isArray(parsed) ? parsed.filter(isPersistedEntry) : [];
+  } catch {
+    return [];
+  }
+};
+
+const writePersisted = (userId: string, entries: PersistedEntry[]) => {
+  try {
+    localStorage.setItem(storageKeyFor(userId), JSON.stringify(entries));
+  } catch {
+    // Storage full or unavailable; the in-memory cache still applies.
+  }
+};
+
+// Web Crypto is only available in secure contexts (HTTPS or localhost).
+// Without it, results are only cached in memory.
+const hashTranscript = async (transcript: string): Promise<string | null> => {
+  if (!globalThis.crypto?.subtle) return null;
+  try {
+    const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(transcript));
+    return Array.from(new Uint8Array(digest), (byte) => byte.toString(16).padStart(2, '0')).join('');
+  } catch {
+    return null;
+  }
+};
+
+export const getCachedAnalysis = async (userId: string, transcript: string): Promise<AnalysisResult | null> => {
+  const generation = cacheGeneration;
+  const cached = memoryFor(userId).get(transcript);
+
+  const hash = await hashTranscript(transcript);
+  if (generation !== cacheGeneration) return null;
+
+  // Memory hits are touched on disk as well, so both layers evict the least
+  // recently used transcript first.
+  let result = cached ?? null;
+  if (hash) {
+    const entries = readPersisted(userId);
+    const index = entries.findIndex(([key]) => key === hash);
+    if (index !== -1) {
+      const [entry] = entries.splice(index, 1);
+      entries.push(entry);
+      writePersisted(userId, entries);
+      result = result ?? entry[1];
+    }
+  }
+  if (!result) return null;
+
+  rememberInMemory(userId, transcript, result);
+  return result;
+};
+
+// `generation` is the getCacheGeneration() value captured when the analysis
+// started; if the cache has been cleared since, the result is not stored.
+export const setCachedAnalysis = async (
+  userId: string,
+  transcript: string,
+  result: AnalysisResult,
+  generation: number
+): Promise<void> => {
+  if (generation !== cacheGeneration) return;
+  rememberInMemory(userId, transcript, result);
+
+  const hash = await hashTranscript(transcript);
+  if (!hash || generation !== cacheGeneration) return;
+
+  const entries = readPersisted(userId).filter(([key]) => key !== hash);
+  entries.push([hash, result]);
+  writePersisted(userId, entries.slice(-MAX_ENTRIES));
+};
+
+export const clearAnalysisCache = (userId: string) => {
+  cacheGeneration++;
+  memoryCache.clear();
+  memoryOwner = null;
+  try {
+    localStorage.removeItem(storageKeyFor(userId));
+  } catch {
+    // Storage unavailable; nothing was persisted to remove.
+  }
+};
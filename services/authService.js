@@ -2,13 +2,23 @@ import bcrypt from 'bcryptjs';
 import jwt from 'jsonwebtoken';
 import mongoose from 'mongoose';
 
-// MongoDB connection
+// MongoDB connection, opened once and shared by every request
+let connectionPromise = null;
+
 const connectDB = async () => {
-  try {
+  if (!connectionPromise) {
     const MONGODB_URI = process.env.MONGODB_URI || 'mongodb://localhost:27017/meetmogger-ai';
-    await mongoose.connect(MONGODB_URI);
-    console.log('✅ MongoDB connected successfully');
+    connectionPromise = mongoose.connect(MONGODB_URI).then((connection) => {
+      console.log('✅ MongoDB connected successfully');
+      return connection;
+    });
+  }
+
+  try {
+    return await connectionPromise;
   } catch (error) {
+    // Allow the next request to retry instead of reusing the failed attempt
+    connectionPromise = null;
     console.error('❌ MongoDB connection error:', error);
     throw error;
   }
@@ -1,76 +1,84 @@
-import { DEMO_ANALYSIS, DEMO_TRANSCRIPTS } from '../demo-config.js';
+import { DEMO_ANALYSIS } from '../demo-config.js';
+
+// Variation tables are built once at module load rather than on every call.
+// Theme variations to make the demo feel more realistic
+const THEME_VARIATIONS = [
+  {
+    theme: {
+      classification: "Technical Support Request",
+      reasoning: "The conversation involves technical troubleshooting and system access issues."
+    }
+  },
+  {
+    theme: {
+      classification: "Billing Inquiry",
+      reasoning: "The customer is seeking clarification about charges and payment issues."
+    }
+  },
+  {
+    theme: {
+      classification: "Product Information Request",
+      reasoning: "The customer is asking about features and capabilities of the service."
+    }
+  }
+];
+
+// Sentiment variations
+const SENTIMENT_OPTIONS = [
+  { polarity: "Positive", tones: ["Satisfied", "Helpful", "Grateful"] },
+  { polarity: "Neutral", tones: ["Professional", "Informative", "Calm"] },
+  { polarity: "Negative", tones: ["Frustrated", "Concerned", "Impatient"] }
+];
+
+// Problem and solution variations
+const PROBLEM_VARIATIONS = [
+  "Account access issues",
+  "Payment processing error",
+  "Feature not working as expected",
+  "Data synchronization problem",
+  "User interface confusion"
+];
+
+const SOLUTION_VARIATIONS = [
+  "Clear step-by-step troubleshooting guide",
+  "Account verification process",
+  "Feature demonstration and training",
+  "Technical support escalation",
+  "Alternative solution provided"
+];
+
+// Pick `count` distinct items at random with a partial Fisher-Yates shuffle,
+// avoiding a full comparator sort of the table on every call.
+const sample = (items, count) => {
+  const pool = [...items];
+  for (let i = 0; i < count; i++) {
+    const j = i + Math.floor(Math.random() * (pool.length - i));
+    [pool[i], pool[j]] = [pool[j], pool[i]];
+  }
+  return pool.slice(0, count);
+};
 
 export const analyzeCallTranscript = async (transcript) => {
   try {
     // Simulate API delay
     await new Promise(resolve => setTimeout(resolve, 2000));
     
-    // Return demo analysis with some randomization
-    const analysis = { ...DEMO_ANALYSIS };
-    
-    // Add some variation to make it feel more realistic
-    const variations = [
-      {
-        theme: {
-          classification: "Technical Support Request",
-          reasoning: "The conversation involves technical troubleshooting and system access issues."
-        }
-      },
-      {
-        theme: {
-          classification: "Billing Inquiry",
-          reasoning: "The customer is seeking clarification about charges and payment issues."
-        }
-      },
-      {
-        theme: {
-          classification: "Product Information Request",
-          reasoning: "The customer is asking about features and capabilities of the service."
-        }
-      }
-    ];
-    
-    const randomVariation = variations[Math.floor(Math.random() * variations.length)];
-    analysis.theme = randomVariation.theme;
-    
-    // Add some random sentiment variations
-    const sentimentOptions = [
-      { polarity: "Positive", tones: ["Satisfied", "Helpful", "Grateful"] },
-      { polarity: "Neutral", tones: ["Professional", "Informative", "Calm"] },
-      { polarity: "Negative", tones: ["Frustrated", "Concerned", "Impatient"] }
-    ];
-    
-    const randomSentiment = sentimentOptions[Math.floor(Math.random() * sentimentOptions.length)];
-    analysis.sentiment = randomSentiment;
+    // Return demo analysis with some randomization. Every nested value is a
+    // fresh copy so callers (and the result cache) never share the module tables.
+    const analysis = { ...DEMO_ANALYSIS, actionItems: [...DEMO_ANALYSIS.actionItems] };
     
-    // Add some variation to problems and solutions
-    const problemVariations = [
-      "Account access issues",
-      "Payment processing error",
-      "Feature not working as expected",
-      "Data synchronization problem",
-      "User interface confusion"
-    ];
+    const randomVariation = THEME_VARIATIONS[Math.floor(Math.random() * THEME_VARIATIONS.length)];
+    analysis.theme = { ...randomVariation.theme };
     
-    const solutionVariations = [
-      "Clear step-by-step troubleshooting guide",
-      "Account verification process",
-      "Feature demonstration and training",
-      "Technical support escalation",
-      "Alternative solution provided"
-    ];
+    const randomSentiment = SENTIMENT_OPTIONS[Math.floor(Math.random() * SENTIMENT_OPTIONS.length)];
+    analysis.sentiment = { ...randomSentiment, tones: [...randomSentiment.tones] };
     
     // Randomly select some problems and solutions
     const numProblems = Math.floor(Math.random() * 3) + 1;
     const numSolutions = Math.floor(Math.random() * 3) + 1;
     
-    analysis.problems = problemVariations
-      .sort(() => 0.5 - Math.random())
-      .slice(0, numProblems);
-      
-    analysis.solutions = solutionVariations
-      .sort(() => 0.5 - Math.random())
-      .slice(0, numSolutions);
+    analysis.problems = sample(PROBLEM_VARIATIONS, numProblems);
+    analysis.solutions = sample(SOLUTION_VARIATIONS, numSolutions);
     
     // Update summary to reflect the variations
     analysis.summary = `Customer contacted support regarding ${analysis.theme.classification.toLowerCase()}. The conversation involved ${analysis.sentiment.polarity.toLowerCase()} sentiment with ${analysis.problems.length} identified issues and ${analysis.solutions.length} proposed solutions. The representative provided comprehensive assistance and scheduled appropriate follow-up actions.`;